@@ -0,0 +1,65 @@
+"""
+bench_recover.py
+
+Benchmark catch/recover against fmap_f with an isinstance chain.
+Run with `python -m benchmarks.bench_recover` from the repository root.
+"""
+
+# Imports
+from timeit import timeit
+
+from monadic_error import Failure, Success, catch
+
+ERRORS = [
+    StopIteration,
+    AttributeError,
+    ImportError,
+    ArithmeticError,
+    LookupError,
+    TypeError,
+    ValueError,
+    OSError,
+]
+FAILURES = [
+    Failure(KeyError()),
+    Failure(UnicodeDecodeError("utf-8", b"", 0, 1, "")),
+    Failure(FileNotFoundError()),
+] * 100
+
+
+def isinstance_chain(e: Exception):
+    if isinstance(e, StopIteration):
+        return Success(0)
+    elif isinstance(e, AttributeError):
+        return Success(1)
+    elif isinstance(e, ImportError):
+        return Success(2)
+    elif isinstance(e, ArithmeticError):
+        return Success(3)
+    elif isinstance(e, LookupError):
+        return Success(4)
+    elif isinstance(e, TypeError):
+        return Success(5)
+    elif isinstance(e, ValueError):
+        return Success(6)
+    elif isinstance(e, OSError):
+        return Success(7)
+    return Failure(e)
+
+
+HANDLERS = catch(
+    {kind: (lambda i: lambda _: Success(i))(i) for i, kind in enumerate(ERRORS)}
+)
+
+
+def main() -> None:
+    chain = timeit(lambda: [f.fmap_f(isinstance_chain) for f in FAILURES], number=2000)
+    table = timeit(lambda: [f.fmap_f(HANDLERS) for f in FAILURES], number=2000)
+    recover = timeit(lambda: [f.recover(HANDLERS) for f in FAILURES], number=2000)
+    print(f"fmap_f + isinstance: {chain:.3f}s")
+    print(f"fmap_f + catch:      {table:.3f}s")
+    print(f"recover + catch:     {recover:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
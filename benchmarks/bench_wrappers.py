@@ -0,0 +1,38 @@
+"""
+bench_wrappers.py
+
+Benchmark specialized attempt/option wrappers against the generic ones.
+Run with `python -m benchmarks.bench_wrappers` from the repository root.
+"""
+
+# Imports
+from timeit import timeit
+
+from monadic_error import attempt, option
+
+
+def add(x, y):
+    return x + y
+
+
+def scale(x, *, factor=2):
+    return x * factor
+
+
+def bench(label: str, call) -> None:
+    print(f"{label:<32}{timeit(call, number=1_000_000):.3f}s")
+
+
+def main() -> None:
+    for name, wrap in (("attempt", attempt), ("option", option)):
+        generic, special = wrap(add), wrap(add, specialize=True)
+        bench(f"{name} positional generic:", lambda: generic(1, 2))
+        bench(f"{name} positional specialized:", lambda: special(1, 2))
+
+        generic, special = wrap(scale), wrap(scale, specialize=True)
+        bench(f"{name} keyword generic:", lambda: generic(1, factor=3))
+        bench(f"{name} keyword specialized:", lambda: special(1, factor=3))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,72 @@
 This contains two monads implemented to handle errors.
 There is also a variety of utility functions to integrate
 well with the current ecosystem.
+
+Only the monads are imported eagerly, everything else is
+imported the first time it is used.
 """
 
-# Exports
-from .attempt import Attempt, Success, Failure
+# Imports
+from typing import TYPE_CHECKING
+from .attempt import Attempt, Success, Failure, catch
 from .option import Option, Some, Nothing
-from .utils import attempt, option, from_optional, note, hush, flatten
+
+# The submodules share their names with the attempt and option
+# utilities, which are loaded lazily by __getattr__.
+del attempt, option
+
+if TYPE_CHECKING:
+    from .utils import attempt, option, from_optional, note, hush, flatten
+    from .stream import amap_attempt, afilter_map, apartition
+    from .cache import PersistentCache
+    from .racing import race, hedge, arace, ahedge
+    from .validate import Schema, FieldError, check
+
+_LAZY = {
+    "attempt": "utils",
+    "option": "utils",
+    "from_optional": "utils",
+    "note": "utils",
+    "hush": "utils",
+    "flatten": "utils",
+    "amap_attempt": "stream",
+    "afilter_map": "stream",
+    "apartition": "stream",
+    "PersistentCache": "cache",
+    "race": "racing",
+    "hedge": "racing",
+    "arace": "racing",
+    "ahedge": "racing",
+    "Schema": "validate",
+    "FieldError": "validate",
+    "check": "validate",
+}
+
+__all__ = [
+    "Attempt",
+    "Success",
+    "Failure",
+    "catch",
+    "Option",
+    "Some",
+    "Nothing",
+    *_LAZY,
+]
+
+
+def __getattr__(name: str):
+    """Import the submodule holding the name on first use."""
+
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
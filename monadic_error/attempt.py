@@ -8,10 +8,11 @@ Attempt Monad
 
 # Imports
 from abc import ABC, abstractmethod
-from typing import Callable, final, TypeGuard
+from typing import Any, Callable, Mapping, final, TypeGuard
 
 type Attempt[F, S] = Success[F, S] | Failure[F, S]
 type Result[S] = Attempt[Exception, S]
+type Handlers[F, A, S] = Mapping[type | tuple[type, ...], Callable[[F], Attempt[A, S]]]
 
 
 class _Attempt[F, S](ABC):
@@ -59,6 +60,14 @@ class _Attempt[F, S](ABC):
     def fmap_f[A](self, func: Callable[[F], "_Attempt[A, S]"]) -> "_Attempt[A, S]":
         """Same as fmap, but for the failure track."""
 
+    @abstractmethod
+    def recover[A](self, handlers: Callable[[F], Attempt[A, S]]) -> Attempt[F | A, S]:
+        """Recover from a failure based on its type.
+
+        The handlers are a dispatch table built once with `catch`.
+        Failures whose type has no handler are left untouched.
+        """
+
     @abstractmethod
     def unwrap_or(self, default: S) -> S:
         """Unwrap the value in success if there is one, otherwise return default."""
@@ -71,11 +80,11 @@ class _Attempt[F, S](ABC):
     def raise_or(self) -> S:
         """Raise if there is something in the failure, otherwise return success."""
 
-    def is_success(self) -> TypeGuard["Success[F, S]"]: # type: ignore
+    def is_success(self) -> TypeGuard["Success[F, S]"]:  # type: ignore
         """Check if the Attempt is a Success."""
         return isinstance(self, Success)
 
-    def is_failure(self) -> TypeGuard["Failure[F, S]"]: # type: ignore
+    def is_failure(self) -> TypeGuard["Failure[F, S]"]:  # type: ignore
         """Check if the Attempt is a Failure."""
         return isinstance(self, Failure)
 
@@ -103,6 +112,9 @@ class Success[F, S](_Attempt[F, S]):
     def fmap_f[A](self, _: Callable[[F], Attempt[A, S]]) -> Attempt[A, S]:
         return Success(self._inner)
 
+    def recover[A](self, _: Callable[[F], Attempt[A, S]]) -> Attempt[F | A, S]:
+        return Success(self._inner)
+
     def unwrap_or(self, _: S) -> S:
         return self._inner
 
@@ -144,6 +156,11 @@ class Failure[F, S](_Attempt[F, S]):
     def fmap_f[A](self, func: Callable[[F], "_Attempt[A, S]"]) -> "_Attempt[A, S]":
         return func(self._inner)
 
+    def recover[A](self, handlers: Callable[[F], Attempt[A, S]]) -> Attempt[F | A, S]:
+        if not callable(handlers):
+            raise TypeError("recover takes a dispatch table built with catch")
+        return handlers(self._inner)
+
     def unwrap_or(self, default: S) -> S:
         return default
 
@@ -164,3 +181,36 @@ class Failure[F, S](_Attempt[F, S]):
             return self._inner == __value._inner
         else:
             return False
+
+
+def catch[F, A, S](handlers: Handlers[F, A, S]) -> Callable[[F], Attempt[F | A, S]]:
+    """Build a dispatch table from a mapping of types to handlers.
+
+    Keys may be a type or a tuple of types, like an except clause.
+    Unlike an except clause, the handler for the closest class in
+    the failure's MRO wins, whatever order the keys are listed in;
+    listing order only matters when a type appears in several keys.
+    The result is cached per concrete type, so a repeated failure
+    costs one lookup.
+    Failures with no handler are returned unchanged.
+    The returned function can be passed to `fmap_f` or `recover`.
+    """
+
+    table: dict[type, Callable[[F], Attempt[Any, S]]] = {}
+    for key, handler in handlers.items():
+        for kind in key if isinstance(key, tuple) else (key,):
+            table.setdefault(kind, handler)
+
+    cache: dict[type, Callable[[F], Attempt[Any, S]]] = {}
+
+    def dispatch(failure: F) -> Attempt[F | A, S]:
+        kind = type(failure)
+        handler = cache.get(kind)
+        if handler is None:
+            handler = next(
+                (table[base] for base in kind.__mro__ if base in table), Failure
+            )
+            cache[kind] = handler
+        return handler(failure)
+
+    return dispatch
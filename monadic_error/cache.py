@@ -0,0 +1,310 @@
+"""
+cache.py
+Ian Kollipara
+2026.10.19
+
+Persistent Cache for Attempt Functions
+"""
+
+# Imports
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import wraps
+from hashlib import sha256
+from inspect import unwrap
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable, TypeVar, overload
+
+from .attempt import Attempt, Failure
+
+F = TypeVar("F")
+S = TypeVar("S")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires);
+CREATE TABLE IF NOT EXISTS meta (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (id, count) SELECT 0, COUNT(*) FROM entries;
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+BEGIN
+    UPDATE meta SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+BEGIN
+    UPDATE meta SET count = count - 1;
+END;
+"""
+
+
+def _dump(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=5)
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize a value so equal arguments hash the same in every process.
+
+    Dicts and sets are sorted, and equal numbers such as 1, 1.0 and True
+    are made the same, like functools.lru_cache. Other types are left
+    as is and keyed by their pickle.
+    """
+
+    kind = type(value)
+    if kind is bool:
+        return int(value)
+    if kind is float and value.is_integer():
+        return int(value)
+    if kind is dict:
+        return (
+            "dict",
+            tuple(
+                sorted(
+                    ((_normalize(k), _normalize(v)) for k, v in value.items()),
+                    key=_dump,
+                )
+            ),
+        )
+    if kind is set or kind is frozenset:
+        return ("set", tuple(sorted(map(_normalize, value), key=_dump)))
+    if kind is list or kind is tuple:
+        return (kind.__name__, tuple(map(_normalize, value)))
+    return value
+
+
+def _fingerprint(code: CodeType) -> bytes:
+    """Hash the bytecode, constants and names of a code object."""
+
+    h = sha256(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            h.update(_fingerprint(const))
+        elif isinstance(const, frozenset):
+            h.update(repr(sorted(map(repr, const))).encode())
+        else:
+            h.update(repr(const).encode())
+    return h.digest()
+
+
+class PersistentCache:
+    """An on-disk cache of Attempts, shared by every process on the host.
+
+    Entries live in a SQLite database in WAL mode, keyed by a hash
+    of the function and its arguments. Each entry can expire after
+    `ttl` seconds, and once there are more than `max_entries` the
+    least recently used tenth is evicted. Reads only record their
+    access time when it is older than `touch_interval` seconds, so
+    most hits do not take the write lock.
+    Failures are only cached with `cache_failures`, and then expire
+    after `failure_ttl` seconds, since they are often transient.
+    Use an instance as a decorator on a function returning an Attempt.
+    Any error from the database is treated as a cache miss.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float | None = None,
+        max_entries: int = 10_000,
+        cache_failures: bool = False,
+        failure_ttl: float | None = 60.0,
+        touch_interval: float = 1.0,
+        timeout: float = 30.0,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache_failures = cache_failures
+        self.failure_ttl = failure_ttl
+        self.touch_interval = touch_interval
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection for this thread, reconnecting after a fork."""
+
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def namespace(self, f: Callable) -> str:
+        """Name the function by its module, qualname and code.
+
+        The code is part of the name, so editing the function
+        stops its old results from being served. Lambdas and
+        local functions cannot be named reliably, so they raise
+        ValueError and need an explicit namespace.
+        """
+
+        qualname = getattr(f, "__qualname__", "")
+        if not qualname or "<lambda>" in qualname or "<locals>" in qualname:
+            raise ValueError(f"cannot name {f!r}, pass a namespace to cache it")
+
+        code = getattr(unwrap(f), "__code__", None)
+        fingerprint = "" if code is None else _fingerprint(code).hex()
+        return f"{f.__module__}.{qualname}:{fingerprint}"
+
+    def key(self, namespace: str, args: tuple, kwargs: dict) -> str:
+        """Hash the namespace and the arguments into a cache key.
+
+        Raises if the arguments cannot be pickled.
+        """
+
+        return sha256(
+            _dump((namespace, _normalize(args), _normalize(kwargs)))
+        ).hexdigest()
+
+    def get(self, key: str) -> Attempt[F, S] | None:
+        """Get the Attempt under the key, or None if it is missing or expired."""
+
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires, accessed = row
+        if expires is not None and expires <= now:
+            conn.execute(
+                "DELETE FROM entries WHERE key = ? AND expires <= ?", (key, now)
+            )
+            return None
+
+        try:
+            result = pickle.loads(value)
+        except Exception:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+        if now - accessed >= self.touch_interval:
+            try:
+                conn.execute(
+                    "UPDATE entries SET accessed = ? WHERE key = ?", (now, key)
+                )
+            except sqlite3.OperationalError:
+                pass
+        return result
+
+    def set(self, key: str, value: Attempt[F, S], ttl: float | None = None) -> None:
+        """Store the Attempt under the key, evicting the least recently used."""
+
+        if ttl is None:
+            ttl = self.failure_ttl if isinstance(value, Failure) else self.ttl
+        data = pickle.dumps(value, protocol=5)
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO entries (key, value, expires, accessed) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                "value = excluded.value, expires = excluded.expires, "
+                "accessed = excluded.accessed",
+                (key, data, expires, now),
+            )
+            conn.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+            (count,) = conn.execute("SELECT count FROM meta").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries + self.max_entries // 10,),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def clear(self) -> None:
+        """Remove every entry."""
+
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @overload
+    def __call__(
+        self, f: Callable[..., Attempt[F, S]], *, namespace: str | None = None
+    ) -> Callable[..., Attempt[F, S]]:
+        """Wrap a function returning an Attempt so its results are cached."""
+
+    @overload
+    def __call__(
+        self, *, namespace: str | None = None
+    ) -> Callable[[Callable[..., Attempt[F, S]]], Callable[..., Attempt[F, S]]]:
+        """Wrap a function returning an Attempt so its results are cached."""
+
+    def __call__(self, f=None, *, namespace=None):
+        """Wrap a function returning an Attempt so its results are cached.
+
+        The namespace separates the entries of each function, and
+        defaults to the name given by the `namespace` method.
+        Functions sharing an explicit namespace share their entries,
+        so change it when the function changes.
+        Calls whose arguments or results cannot be pickled are not cached.
+        """
+
+        if f is None:
+            return lambda f: self(f, namespace=namespace)
+
+        if namespace is None:
+            namespace = self.namespace(f)
+
+        @wraps(f)
+        def inner(*args, **kwargs):
+            try:
+                key = self.key(namespace, args, kwargs)
+            except Exception:
+                return f(*args, **kwargs)
+
+            try:
+                cached = self.get(key)
+            except sqlite3.Error:
+                cached = None
+            if cached is not None:
+                return cached
+
+            result = f(*args, **kwargs)
+            if self.cache_failures or not isinstance(result, Failure):
+                try:
+                    self.set(key, result)
+                except (
+                    sqlite3.Error,
+                    pickle.PicklingError,
+                    TypeError,
+                    AttributeError,
+                ):
+                    pass
+            return result
+
+        return inner
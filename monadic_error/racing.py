@@ -0,0 +1,174 @@
+"""
+racing.py
+Ian Kollipara
+2026.10.19
+
+Hedged Racing of Attempt Functions
+"""
+
+# Imports
+import asyncio
+import threading
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Awaitable, Callable, TypeVar
+
+from .attempt import Attempt, Failure, Success, _Attempt
+
+F = TypeVar("F")
+S = TypeVar("S")
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool() -> ThreadPoolExecutor:
+    """Get the thread pool shared by every hedge, creating it on first use."""
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(thread_name_prefix="monadic-error-hedge")
+        return _pool
+
+
+def _outcome(
+    future: "Future[Attempt[F, S]] | asyncio.Task[Attempt[F, S]]",
+) -> Attempt[Any, S]:
+    """Get the Attempt from a finished future.
+
+    A raise becomes a Failure of the exception, and a result that is
+    not an Attempt becomes a Failure of a TypeError.
+    """
+
+    try:
+        result = future.result()
+    except Exception as e:
+        return Failure(e)
+
+    if not isinstance(result, _Attempt):
+        return Failure(TypeError(f"expected an Attempt, got {result!r}"))
+    return result  # type: ignore
+
+
+def hedge(
+    *funcs: Callable[[], Attempt[F, S]],
+    delay: float,
+    executor: Executor | None = None,
+) -> Attempt[list[F], S]:
+    """Run the functions in threads, starting each one only if the previous are slow.
+
+    The first function starts right away, and the next one starts
+    once `delay` seconds pass without a Success, or as soon as a
+    running function fails. The first Success is returned and the
+    stragglers are left to finish in the background.
+    If every function fails, the Failure holds every error in order.
+    A function returning something other than an Attempt fails
+    with a TypeError.
+
+    The functions run on a thread pool shared by every call, where
+    stragglers hold on to their threads until they finish. Pass an
+    `executor` to keep slow functions from delaying other callers.
+    """
+
+    if not funcs:
+        raise ValueError("hedge needs at least one function")
+
+    pool = executor or _shared_pool()
+    pending: dict[Future[Attempt[F, S]], int] = {}
+    errors: list[Any] = [None] * len(funcs)
+    launched = 0
+    try:
+        while True:
+            if launched < len(funcs) and (not pending or time.monotonic() >= deadline):
+                pending[pool.submit(funcs[launched])] = launched
+                launched += 1
+                deadline = time.monotonic() + delay
+
+            if not pending:
+                return Failure(errors)
+
+            timeout = (
+                max(deadline - time.monotonic(), 0) if launched < len(funcs) else None
+            )
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                match _outcome(future):
+                    case Success(v):
+                        return Success(v)
+
+                    case Failure(e):
+                        errors[index] = e
+                        deadline = time.monotonic()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def race(
+    *funcs: Callable[[], Attempt[F, S]], executor: Executor | None = None
+) -> Attempt[list[F], S]:
+    """Run every function at once in threads and return the first Success."""
+
+    return hedge(*funcs, delay=0, executor=executor)
+
+
+async def ahedge(
+    *funcs: Callable[[], Awaitable[Attempt[F, S]]], delay: float
+) -> Attempt[list[F], S]:
+    """Same as hedge, but for coroutine functions.
+
+    The stragglers are cancelled once there is a Success.
+    """
+
+    if not funcs:
+        raise ValueError("ahedge needs at least one function")
+
+    loop = asyncio.get_running_loop()
+    pending: dict[asyncio.Task[Attempt[F, S]], int] = {}
+    errors: list[Any] = [None] * len(funcs)
+    launched = 0
+    try:
+        while True:
+            if launched < len(funcs) and (not pending or loop.time() >= deadline):
+                try:
+                    pending[asyncio.ensure_future(funcs[launched]())] = launched
+                except Exception as e:
+                    errors[launched] = e
+                launched += 1
+                deadline = loop.time() + delay
+
+            if not pending:
+                if launched < len(funcs):
+                    continue
+                return Failure(errors)
+
+            timeout = max(deadline - loop.time(), 0) if launched < len(funcs) else None
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                index = pending.pop(task)
+                match _outcome(task):
+                    case Success(v):
+                        return Success(v)
+
+                    case Failure(e):
+                        errors[index] = e
+                        deadline = loop.time()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def arace(*funcs: Callable[[], Awaitable[Attempt[F, S]]]) -> Attempt[list[F], S]:
+    """Run every coroutine function at once and return the first Success."""
+
+    return await ahedge(*funcs, delay=0)
@@ -0,0 +1,196 @@
+"""
+stream.py
+Ian Kollipara
+2026.10.19
+
+Async Stream Combinators over Attempts
+"""
+
+# Imports
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from inspect import isawaitable
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, TypeVar
+
+from .attempt import Attempt, Failure, Result, Success, _Attempt
+
+A = TypeVar("A")
+B = TypeVar("B")
+F = TypeVar("F")
+S = TypeVar("S")
+
+
+async def _run(func: Callable[[A], Awaitable[B] | B], item: A) -> Result[B]:
+    """Run a step, wrapping its result or exception in an Attempt."""
+
+    try:
+        result = func(item)
+        if isawaitable(result):
+            result = await result
+    except Exception as e:
+        return Failure(e)
+
+    if isinstance(result, _Attempt):
+        return result  # type: ignore
+    return Success(result)
+
+
+async def amap_attempt(
+    func: Callable[[A], Awaitable[B] | B],
+    source: AsyncIterable[A],
+    *,
+    limit: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[Result[B]]:
+    """Apply an async step to every item of the source with at most `limit` in flight.
+
+    The step may also be synchronous, such as an @attempt function,
+    in which case it runs on the event loop; wrap it with
+    asyncio.to_thread if it blocks. Exceptions raised by the step
+    become Failures, and Attempts returned by the step are passed
+    through as is. The source is only pulled when a slot is free,
+    so a slow consumer slows the source down.
+    With `ordered`, results come out in source order, otherwise
+    they come out as they complete.
+    """
+
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    iterator = aiter(source)
+    pending: deque[asyncio.Task[Result[B]]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    pending.append(asyncio.create_task(_run(func, item)))
+
+            if not pending:
+                return
+
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.remove(task)
+                    yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def afilter_map(
+    func: Callable[[A], Awaitable[B] | B],
+    source: AsyncIterable[A],
+    on_failure: Callable[[Exception], Any] | None = None,
+    *,
+    limit: int = 8,
+    ordered: bool = True,
+) -> AsyncIterator[B]:
+    """Same as amap_attempt, but only yield the unwrapped successes.
+
+    Failures are routed to `on_failure` without stopping the stream.
+    It may be a coroutine function, such as the `put` of a bounded
+    asyncio.Queue, in which case a full side channel applies backpressure.
+    """
+
+    async with aclosing(
+        amap_attempt(func, source, limit=limit, ordered=ordered)
+    ) as results:
+        async for result in results:
+            match result:
+                case Success(v):
+                    yield v
+
+                case Failure(e):
+                    if on_failure is not None:
+                        handled = on_failure(e)
+                        if isawaitable(handled):
+                            await handled
+
+
+def apartition(
+    attempts: AsyncIterable[Attempt[F, S]], *, maxsize: int = 64
+) -> tuple[AsyncIterator[S], AsyncIterator[F]]:
+    """Split a stream of Attempts into a stream of successes and a stream of failures.
+
+    The source is pulled by whichever side needs a value, and values
+    for the other side are buffered in a queue of at most `maxsize`.
+    When that buffer is full, the source is not pulled until it is
+    drained, so both sides must be consumed concurrently. Once a side
+    is closed, its values are dropped so the other side keeps flowing.
+    Nothing runs in the background, so closing every side stops the
+    source from being pulled.
+    Errors raised by the source are raised from both sides.
+    """
+
+    source = aiter(attempts)
+    lock = asyncio.Lock()
+    successes: asyncio.Queue[S] = asyncio.Queue(maxsize)
+    failures: asyncio.Queue[F] = asyncio.Queue(maxsize)
+    closed: list[asyncio.Queue[Any]] = []
+    error: Exception | None = None
+    exhausted = False
+
+    async def pull() -> tuple[asyncio.Queue[Any], Any] | None:
+        """Pull the next value and the queue it belongs to."""
+
+        nonlocal error, exhausted
+        try:
+            result = await anext(source)
+        except StopAsyncIteration:
+            exhausted = True
+            return None
+        except Exception as e:
+            error, exhausted = e, True
+            return None
+
+        match result:
+            case Success(v):
+                return successes, v
+
+            case Failure(e):
+                return failures, e
+
+    async def drain(mine: asyncio.Queue[A]) -> AsyncIterator[A]:
+        try:
+            while True:
+                if not mine.empty():
+                    yield mine.get_nowait()
+                    continue
+
+                if exhausted:
+                    if error is not None:
+                        raise error
+                    return
+
+                async with lock:
+                    if not mine.empty() or exhausted:
+                        continue
+
+                    pulled = await pull()
+                    if pulled is None:
+                        continue
+
+                    queue, value = pulled
+                    if queue is not mine:
+                        if queue not in closed:
+                            await queue.put(value)
+                        continue
+
+                yield value
+        finally:
+            closed.append(mine)
+            while not mine.empty():
+                mine.get_nowait()
+
+    return drain(successes), drain(failures)
@@ -12,10 +12,119 @@ from typing import Any, Callable, Optional, overload, TypeVar
 from .attempt import Attempt, Success, Failure, Result
 from .option import Option, Some, Nothing
 
+R = TypeVar("R")
 
-def option[A](f: Callable[..., A]) -> Callable[..., Option[A]]:
+
+_OPTION_TEMPLATE = """
+def __me_inner({params}):
+    try:
+        return __me_Some(__me_f({call}))
+    except Exception:
+        return __me_Nothing()
+"""
+
+_ATTEMPT_TEMPLATE = """
+def __me_inner({params}):
+    try:
+        return __me_Success(__me_f({call}))
+    except Exception as __me_e:
+        return __me_Failure(__me_e)
+"""
+
+
+def _specialize(
+    f: Callable, template: str, namespace: dict[str, Any]
+) -> Callable | None:
+    """Generate a wrapper from the template with the same parameters as f.
+
+    Returns None if the signature of f cannot be read or mirrored.
+    """
+
+    from inspect import Parameter, signature
+
+    try:
+        parameters = signature(f, follow_wrapped=False).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    params: list[str] = []
+    call: list[str] = []
+    namespace = {**namespace, "__me_f": f}
+    star = posonly = False
+    for i, p in enumerate(parameters):
+        if p.name.startswith("__me_"):
+            return None
+
+        if posonly and p.kind is not Parameter.POSITIONAL_ONLY:
+            params.append("/")
+        posonly = p.kind is Parameter.POSITIONAL_ONLY
+
+        param = p.name
+        if p.default is not Parameter.empty:
+            namespace[f"__me_d{i}"] = p.default
+            param += f"=__me_d{i}"
+
+        match p.kind:
+            case Parameter.POSITIONAL_ONLY | Parameter.POSITIONAL_OR_KEYWORD:
+                params.append(param)
+                call.append(p.name)
+
+            case Parameter.VAR_POSITIONAL:
+                star = True
+                params.append(f"*{p.name}")
+                call.append(f"*{p.name}")
+
+            case Parameter.KEYWORD_ONLY:
+                if not star:
+                    star = True
+                    params.append("*")
+                params.append(param)
+                call.append(f"{p.name}={p.name}")
+
+            case Parameter.VAR_KEYWORD:
+                params.append(f"**{p.name}")
+                call.append(f"**{p.name}")
+
+    if posonly:
+        params.append("/")
+
+    exec(template.format(params=", ".join(params), call=", ".join(call)), namespace)
+    return namespace["__me_inner"]
+
+
+@overload
+def option(
+    f: Callable[..., R], *, specialize: bool = False
+) -> Callable[..., Option[R]]:
+    """Wrap a raising function and return an Option."""
+
+
+@overload
+def option(
+    *, specialize: bool = False
+) -> Callable[[Callable[..., R]], Callable[..., Option[R]]]:
     """Wrap a raising function and return an Option."""
 
+
+def option[A](f: Callable[..., A] | None = None, *, specialize: bool = False):
+    """Wrap a raising function and return an Option.
+
+    With `specialize`, the wrapper is generated with the same parameters
+    as the function, which avoids packing the arguments on every call.
+    Calls with the wrong arguments then raise TypeError instead of
+    returning Nothing.
+    """
+
+    if f is None:
+        return lambda f: option(f, specialize=specialize)
+
+    if specialize:
+        inner = _specialize(
+            f, _OPTION_TEMPLATE, {"__me_Some": Some, "__me_Nothing": Nothing}
+        )
+        if inner is not None:
+            return wraps(f)(inner)
+
     @wraps(f)
     def inner(*args, **kwargs) -> Option[A]:
         try:
@@ -36,9 +145,39 @@ def from_optional[A](optional: Optional[A]) -> Option[A]:
         return Nothing()
 
 
-def attempt[A](f: Callable[..., A]) -> Callable[..., Result[A]]:
+@overload
+def attempt(
+    f: Callable[..., R], *, specialize: bool = False
+) -> Callable[..., Result[R]]:
+    """Wrap a raising function and return an Attempt of Exception and the return type."""
+
+
+@overload
+def attempt(
+    *, specialize: bool = False
+) -> Callable[[Callable[..., R]], Callable[..., Result[R]]]:
     """Wrap a raising function and return an Attempt of Exception and the return type."""
 
+
+def attempt[A](f: Callable[..., A] | None = None, *, specialize: bool = False):
+    """Wrap a raising function and return an Attempt of Exception and the return type.
+
+    With `specialize`, the wrapper is generated with the same parameters
+    as the function, which avoids packing the arguments on every call.
+    Calls with the wrong arguments then raise TypeError instead of
+    returning a Failure.
+    """
+
+    if f is None:
+        return lambda f: attempt(f, specialize=specialize)
+
+    if specialize:
+        inner = _specialize(
+            f, _ATTEMPT_TEMPLATE, {"__me_Success": Success, "__me_Failure": Failure}
+        )
+        if inner is not None:
+            return wraps(f)(inner)
+
     @wraps(f)
     def inner(*args, **kwargs) -> Result[A]:
         try:
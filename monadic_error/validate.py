@@ -0,0 +1,103 @@
+"""
+validate.py
+Ian Kollipara
+2026.10.19
+
+Accumulating Record Validation
+"""
+
+# Imports
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    final,
+)
+
+from .attempt import Attempt, Failure, Success, _Attempt
+
+type Validator = Callable[[Any], Any]
+
+
+class FieldError(NamedTuple):
+    """The error raised, or the Failure returned, while validating a field."""
+
+    field: str
+    error: Any
+
+
+def check[A](predicate: Callable[[A], bool], message: str) -> Callable[[A], A]:
+    """Turn a predicate into a validator that raises ValueError with the message."""
+
+    def validator(value: A) -> A:
+        if not predicate(value):
+            raise ValueError(message)
+        return value
+
+    return validator
+
+
+@final
+class Schema:
+    """A record schema compiled from a mapping of fields to validators.
+
+    A validator takes the field value and returns the validated value,
+    raising if it is invalid. It can also return an Attempt, such as an
+    @attempt function, and then a Success passes its value on while a
+    Failure is the field's error. A field can have a sequence of validators,
+    which are chained, and a field stops at its first error.
+    Unlike fmap, the errors of every field are accumulated.
+    """
+
+    def __init__(self, fields: Mapping[str, Validator | Sequence[Validator]]) -> None:
+        self._fields = tuple(
+            (
+                name,
+                tuple(validators)
+                if isinstance(validators, Sequence)
+                else (validators,),
+            )
+            for name, validators in fields.items()
+        )
+
+    def validate(
+        self, record: Mapping[str, Any]
+    ) -> Attempt[list[FieldError], dict[str, Any]]:
+        """Validate the record.
+
+        Returns a Success of the validated fields, or a Failure
+        of every field error, in schema order.
+        A missing field is a KeyError.
+        """
+
+        validated: dict[str, Any] = {}
+        errors: list[FieldError] = []
+        for name, validators in self._fields:
+            try:
+                value = record[name]
+                for validator in validators:
+                    value = validator(value)
+                    if isinstance(value, _Attempt):
+                        if isinstance(value, Failure):
+                            errors.append(FieldError(name, value._inner))
+                            break
+                        value = value._inner
+                else:
+                    validated[name] = value
+            except Exception as e:
+                errors.append(FieldError(name, e))
+
+        if errors:
+            return Failure(errors)
+        return Success(validated)
+
+    def validate_many(
+        self, records: Iterable[Mapping[str, Any]]
+    ) -> Iterator[Attempt[list[FieldError], dict[str, Any]]]:
+        """Lazily validate every record, in order."""
+
+        return map(self.validate, records)
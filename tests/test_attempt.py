@@ -7,7 +7,7 @@ Test Attempt Monad
 """
 
 # Imports
-from monadic_error.attempt import Success, Failure
+from monadic_error.attempt import Success, Failure, catch
 from pytest import raises
 
 
@@ -146,3 +146,58 @@ def test_success_is_not_failure():
 # Test that Failure is failure
 def test_failure_is_failure():
     assert Failure(1).is_failure()
+
+
+# Test that Failure can be recovered by exception type
+def test_failure_recover():
+    handlers = catch({ValueError: lambda e: Success(str(e))})
+    assert Failure(ValueError("bad")).recover(handlers) == Success("bad")
+
+
+# Test that recover resolves handlers through the MRO
+def test_failure_recover_mro():
+    handlers = catch(
+        {LookupError: lambda _: Success(0), Exception: lambda _: Success(1)}
+    )
+    assert Failure(KeyError("k")).recover(handlers) == Success(0)
+    assert Failure(TypeError()).recover(handlers) == Success(1)
+
+
+# Test that unhandled failures are left unchanged
+def test_failure_recover_unhandled():
+    error = TypeError()
+    assert Failure(error).recover(catch({ValueError: lambda _: Success(0)})) == Failure(
+        error
+    )
+
+
+# Test that Success ignores recover
+def test_success_recover():
+    assert Success(1).recover(catch({ValueError: lambda _: Success(0)})) == Success(1)
+
+
+# Test that recover needs a table built with catch
+def test_failure_recover_mapping():
+    with raises(TypeError):
+        handlers = {ValueError: lambda _: Success(0)}
+        Failure(ValueError()).recover(handlers)  # type: ignore
+
+
+# Test that catch accepts tuples of types and can be reused
+def test_catch():
+    handler = catch({(KeyError, IndexError): lambda _: Success(None)})
+    assert Failure(IndexError()).recover(handler) == Success(None)
+    assert Failure(KeyError()).fmap_f(handler) == Success(None)
+    assert Failure(1).fmap_f(handler) == Failure(1)
+
+
+# Test that the closest class wins even when a broader handler is listed first
+def test_catch_closest_class():
+    handler = catch(
+        {
+            Exception: lambda _: Success("broad"),
+            LookupError: lambda _: Success("lookup"),
+        }
+    )
+    assert Failure(KeyError()).recover(handler) == Success("lookup")
+    assert Failure(TypeError()).recover(handler) == Success("broad")
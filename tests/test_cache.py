@@ -0,0 +1,226 @@
+"""
+test_cache.py
+Ian Kollipara <ian.kollipara@cune.edu>
+2026.10.19
+
+Test Persistent Cache
+"""
+
+# Imports
+import sqlite3
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pytest import raises
+
+from monadic_error.attempt import Failure, Success
+from monadic_error.cache import PersistentCache
+from monadic_error.utils import attempt
+
+
+@attempt
+def square(x):
+    return x * x
+
+
+def cached_square(path, x):
+    return PersistentCache(path)(square)(x)
+
+
+# Test that results are cached across cache instances
+def test_cache_persists(tmp_path):
+    calls = []
+
+    def parse(s):
+        calls.append(s)
+        return int(s)
+
+    first = PersistentCache(tmp_path / "cache.db")(attempt(parse), namespace="parse")
+    assert first("1") == Success(1)
+    assert first("1") == Success(1)
+
+    second = PersistentCache(tmp_path / "cache.db")(attempt(parse), namespace="parse")
+    assert second("1") == Success(1)
+    assert calls == ["1"]
+
+
+# Test that failures are only cached when enabled
+def test_cache_failures(tmp_path):
+    calls = []
+
+    @attempt
+    def parse(s):
+        calls.append(s)
+        return int(s)
+
+    cached = PersistentCache(tmp_path / "a.db", cache_failures=True)(
+        parse, namespace="parse"
+    )
+    assert isinstance(cached("x").unwrap_f_or(None), ValueError)
+    assert isinstance(cached("x").unwrap_f_or(None), ValueError)
+    assert calls == ["x"]
+
+    uncached = PersistentCache(tmp_path / "b.db")(parse, namespace="parse")
+    uncached("x")
+    uncached("x")
+    assert calls == ["x", "x", "x"]
+
+
+# Test that entries expire after their TTL
+def test_cache_ttl(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db")
+    cache.set("a", Success(1), ttl=0.01)
+    cache.set("b", Success(2))
+    assert cache.get("a") == Success(1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.get("b") == Success(2)
+
+
+# Test that failures expire after the failure TTL
+def test_cache_failure_ttl(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db", failure_ttl=0.01)
+    cache.set("a", Failure("a"))
+    cache.set("b", Success(2))
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.get("b") == Success(2)
+
+
+# Test that the least recently used entries are evicted
+def test_cache_lru(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db", max_entries=2, touch_interval=0)
+    cache.set("a", Success(1))
+    cache.set("b", Success(2))
+    cache.get("a")
+    cache.set("c", Success(3))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == Success(1)
+
+
+# Test that eviction removes a tenth of the entries at once
+def test_cache_evicts_in_batches(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db", max_entries=20)
+    for i in range(21):
+        cache.set(str(i), Success(i))
+    assert len(cache) == 18
+    assert cache.get("0") is None
+    assert cache.get("20") == Success(20)
+
+
+# Test that recent hits do not write the access time
+def test_cache_touch_interval(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db", touch_interval=60)
+    cache.set("a", Success(1))
+    conn = cache._connect()
+    (accessed,) = conn.execute("SELECT accessed FROM entries").fetchone()
+    assert cache.get("a") == Success(1)
+    assert conn.execute("SELECT accessed FROM entries").fetchone() == (accessed,)
+
+
+# Test that unpicklable arguments skip the cache
+def test_cache_unpicklable(tmp_path):
+    cached = PersistentCache(tmp_path / "cache.db")(
+        attempt(lambda f: f()), namespace="call"
+    )
+    assert cached(lambda: 1) == Success(1)
+    assert len(PersistentCache(tmp_path / "cache.db")) == 0
+
+
+# Test that max_entries must be positive
+def test_cache_bad_max_entries(tmp_path):
+    with raises(ValueError):
+        PersistentCache(tmp_path / "cache.db", max_entries=0)
+
+
+# Test that several processes can share the cache
+def test_cache_processes(tmp_path):
+    path = tmp_path / "cache.db"
+    with ProcessPoolExecutor(4) as pool:
+        results = list(pool.map(cached_square, [path] * 40, list(range(10)) * 4))
+
+    assert results == [Success(x * x) for x in range(10)] * 4
+    assert len(PersistentCache(path)) == 10
+
+
+# Test that two lambdas sharing a database do not share entries
+def test_cache_lambdas(tmp_path):
+    cache = PersistentCache(tmp_path / "cache.db")
+    inc = cache(attempt(lambda x: x + 1), namespace="inc")
+    dbl = cache(namespace="dbl")(attempt(lambda x: x * 2))
+    assert inc(3) == Success(4)
+    assert dbl(3) == Success(6)
+
+    with raises(ValueError):
+        cache(attempt(lambda x: x + 1))
+    with raises(ValueError):
+        cache(attempt(lambda x: x * 2))
+
+
+# Test that the namespace changes with the code of the function
+def test_cache_namespace_code():
+    cache = PersistentCache(":memory:")
+
+    def first(x):
+        return x + 1
+
+    def second(x):
+        return x + 2
+
+    second.__qualname__ = first.__qualname__ = "parse"
+    assert cache.namespace(attempt(first)) != cache.namespace(attempt(second))
+    assert cache.namespace(square) == cache.namespace(square)
+
+
+# Test that equal arguments give the same key
+def test_cache_key_normalized():
+    cache = PersistentCache(":memory:")
+    assert cache.key("f", (1,), {}) == cache.key("f", (1.0,), {})
+    assert cache.key("f", ({"a": 1, "b": 2},), {}) == cache.key(
+        "f", ({"b": 2, "a": 1},), {}
+    )
+    assert cache.key("f", (), {"a": 1, "b": 2}) == cache.key("f", (), {"b": 2, "a": 1})
+    assert cache.key("f", ([1],), {}) != cache.key("f", ((1,),), {})
+
+
+# Test that keys of sets are the same in every process
+def test_cache_key_hash_seed():
+    code = (
+        "from monadic_error.cache import PersistentCache;"
+        "args = (frozenset('abcdefgh'), {'x', 'y'});"
+        "print(PersistentCache(':memory:').key('f', args, {}))"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parent.parent,
+            env={"PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2", "3")
+    }
+    assert len(keys) == 1
+
+
+# Test that a locked database falls back to calling the function
+def test_cache_locked(tmp_path):
+    path = tmp_path / "cache.db"
+    cached = PersistentCache(path, timeout=0.1)(square)
+    assert cached(2) == Success(4)
+
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN EXCLUSIVE")
+    try:
+        assert cached(3) == Success(9)
+        assert cached(2) == Success(4)
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    assert cached(3) == Success(9)
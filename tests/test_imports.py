@@ -0,0 +1,86 @@
+"""
+test_imports.py
+Ian Kollipara <ian.kollipara@cune.edu>
+2026.10.19
+
+Test Package Import Cost
+"""
+
+# Imports
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Budget for importing the package and getting the monads, as a multiple
+# of importing typing alone, which the monads need anyway.
+# Today it is about 1.5 to 2.5 times, and eagerly importing every
+# submodule costs about 7 times.
+IMPORT_BUDGET = 3.5
+
+
+def run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+# Test that importing the monads does not load the other submodules
+def test_lazy_submodules():
+    modules = run(
+        "from monadic_error import Success, Some; import sys; print(*sys.modules)"
+    ).stdout.split()
+    lazy = ("utils", "stream", "cache", "racing", "validate")
+    for module in (*(f"monadic_error.{m}" for m in lazy), "asyncio", "sqlite3"):
+        assert module not in modules
+
+
+# Test that lazy names resolve to the utilities, not the submodules
+def test_lazy_names():
+    import monadic_error
+    from monadic_error.racing import race
+    from monadic_error.utils import attempt, option
+
+    assert monadic_error.attempt is attempt
+    assert monadic_error.option is option
+    assert monadic_error.race is race
+    assert set(monadic_error.__all__) <= set(dir(monadic_error))
+
+
+# Test that using every export never imports NumPy
+def test_no_numpy():
+    code = (
+        "import monadic_error, sys;"
+        "[getattr(monadic_error, n) for n in monadic_error.__all__];"
+        "print(*sys.modules)"
+    )
+    assert "numpy" not in run(code).stdout.split()
+
+
+def import_time(code: str, package: str) -> int:
+    """Get the fastest cumulative import time of the package, in microseconds."""
+
+    times = []
+    for _ in range(5):
+        total = 0
+        # Without site, .pth hooks cannot import typing ahead of the code
+        for line in run(code, "-S", "-X", "importtime").stderr.splitlines():
+            if line.count("|") != 2:
+                continue
+            _, cumulative, name = line.split("|")
+            if name.startswith(f" {package}"):
+                total += int(cumulative)
+        times.append(total)
+    return min(times)
+
+
+# Test that importing the package stays within the budget
+def test_import_time():
+    package = import_time("from monadic_error import Success", "monadic_error")
+    baseline = import_time("import typing", "typing")
+    assert 0 < package < IMPORT_BUDGET * baseline
@@ -0,0 +1,172 @@
+"""
+test_racing.py
+Ian Kollipara <ian.kollipara@cune.edu>
+2026.10.19
+
+Test Hedged Racing
+"""
+
+# Imports
+import asyncio
+import threading
+import time
+
+from pytest import raises
+
+from monadic_error.attempt import Failure, Success
+from monadic_error.racing import ahedge, arace, hedge, race
+
+
+def slow(value, seconds, calls=None):
+    def inner():
+        if calls is not None:
+            calls.append(value)
+        time.sleep(seconds)
+        return value
+
+    return inner
+
+
+def aslow(value, seconds, calls=None):
+    async def inner():
+        if calls is not None:
+            calls.append(value)
+        await asyncio.sleep(seconds)
+        return value
+
+    return inner
+
+
+def boom():
+    raise RuntimeError("boom")
+
+
+# Test that race returns the fastest Success
+def test_race():
+    assert race(slow(Success(1), 0.2), slow(Success(2), 0.01)) == Success(2)
+
+
+# Test that race skips Failures
+def test_race_failure_skipped():
+    assert race(slow(Failure("a"), 0), slow(Success(2), 0.05)) == Success(2)
+
+
+# Test that every error is collected in order
+def test_race_all_fail():
+    result = race(slow(Failure("a"), 0.05), slow(Failure("b"), 0), boom)
+    errors = result.unwrap_f_or(None)
+    assert errors[:2] == ["a", "b"]
+    assert isinstance(errors[2], RuntimeError)
+
+
+# Test that hedge does not start backups when the primary is fast
+def test_hedge_fast_primary():
+    calls = []
+    assert hedge(
+        slow(Success(1), 0, calls), slow(Success(2), 0, calls), delay=0.2
+    ) == Success(1)
+    assert calls == [Success(1)]
+
+
+# Test that hedge starts a backup when the primary is slow
+def test_hedge_slow_primary():
+    calls = []
+    start = time.monotonic()
+    result = hedge(slow(Success(1), 0.5, calls), slow(Success(2), 0, calls), delay=0.05)
+    assert result == Success(2)
+    assert calls == [Success(1), Success(2)]
+    assert time.monotonic() - start < 0.4
+
+
+# Test that hedge starts a backup right away when the primary fails
+def test_hedge_failed_primary():
+    start = time.monotonic()
+    assert hedge(slow(Failure("a"), 0), slow(Success(2), 0), delay=1) == Success(2)
+    assert time.monotonic() - start < 0.5
+
+
+# Test that hedge needs a function
+def test_hedge_empty():
+    with raises(ValueError):
+        hedge(delay=0)
+
+
+# Test that arace returns the fastest Success
+def test_arace():
+    result = asyncio.run(arace(aslow(Success(1), 0.2), aslow(Success(2), 0.01)))
+    assert result == Success(2)
+
+
+# Test that ahedge cancels the stragglers
+def test_ahedge_cancels():
+    cancelled = []
+
+    async def straggler():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return Success(1)
+
+    async def run():
+        result = await ahedge(straggler, aslow(Success(2), 0), delay=0.01)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == Success(2)
+    assert cancelled == [True]
+
+
+# Test that ahedge collects every error
+def test_ahedge_all_fail():
+    async def aboom():
+        raise RuntimeError("boom")
+
+    result = asyncio.run(ahedge(aslow(Failure("a"), 0), aboom, delay=0.01))
+    errors = result.unwrap_f_or(None)
+    assert errors[0] == "a"
+    assert isinstance(errors[1], RuntimeError)
+
+
+# Test that ahedge records a callable raising before it is awaited
+def test_ahedge_sync_raise():
+    def sync_boom():
+        raise RuntimeError("sync")
+
+    result = asyncio.run(ahedge(sync_boom, aslow(Success(2), 0), delay=1))
+    assert result == Success(2)
+
+    result = asyncio.run(ahedge(aslow(Failure("a"), 0), sync_boom, delay=0.01))
+    errors = result.unwrap_f_or(None)
+    assert errors[0] == "a"
+    assert isinstance(errors[1], RuntimeError)
+
+
+# Test that results other than Attempts become Failures
+def test_race_non_attempt():
+    errors = race(lambda: 1, lambda: 2).unwrap_f_or(None)
+    assert all(isinstance(e, TypeError) for e in errors)
+    assert race(lambda: 1, slow(Success(2), 0.01)) == Success(2)
+
+    async def one():
+        return 1
+
+    errors = asyncio.run(arace(one)).unwrap_f_or(None)
+    assert isinstance(errors[0], TypeError)
+
+
+# Test that hedge reuses a shared thread pool
+def test_hedge_shared_pool():
+    from monadic_error.racing import _shared_pool
+
+    names = []
+
+    def record():
+        names.append(threading.current_thread().name)
+        return Success(None)
+
+    hedge(record, delay=0)
+    hedge(record, delay=0)
+    assert all(name.startswith("monadic-error-hedge") for name in names)
+    assert _shared_pool() is _shared_pool()
@@ -0,0 +1,195 @@
+"""
+test_stream.py
+Ian Kollipara <ian.kollipara@cune.edu>
+2026.10.19
+
+Test Async Stream Combinators
+"""
+
+# Imports
+import asyncio
+
+from pytest import raises
+
+from monadic_error.attempt import Failure, Success
+from monadic_error.stream import afilter_map, amap_attempt, apartition
+
+
+class FakeConsumer:
+    """A local stand-in for a message-queue consumer."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.pulled = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self.pulled == len(self.messages):
+            raise StopAsyncIteration
+        self.pulled += 1
+        return self.messages[self.pulled - 1]
+
+
+async def collect(stream):
+    return [x async for x in stream]
+
+
+async def step(x):
+    await asyncio.sleep(0.01 * (5 - x))
+    if x == 3:
+        raise ValueError(x)
+    return x * 2
+
+
+# Test that amap_attempt keeps source order and wraps errors
+def test_amap_attempt_ordered():
+    results = asyncio.run(collect(amap_attempt(step, FakeConsumer(range(5)), limit=3)))
+    assert [r.unwrap_or(None) for r in results] == [0, 2, 4, None, 8]
+    assert isinstance(results[3].unwrap_f_or(None), ValueError)
+
+
+# Test that unordered output comes out in completion order
+def test_amap_attempt_unordered():
+    results = asyncio.run(
+        collect(amap_attempt(step, FakeConsumer(range(5)), limit=5, ordered=False))
+    )
+    assert [r.unwrap_or(None) for r in results] == [8, None, 4, 2, 0]
+
+
+# Test that returned Attempts are passed through
+def test_amap_attempt_passthrough():
+    async def check(x):
+        return Success(x) if x else Failure("zero")
+
+    results = asyncio.run(collect(amap_attempt(check, FakeConsumer([0, 1]))))
+    assert results == [Failure("zero"), Success(1)]
+
+
+# Test that no more than limit steps run at once
+def test_amap_attempt_limit():
+    running = peak = 0
+
+    async def track(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return x
+
+    asyncio.run(collect(amap_attempt(track, FakeConsumer(range(20)), limit=4)))
+    assert peak == 4
+
+
+# Test that the source is not pulled ahead of a slow consumer
+def test_amap_attempt_backpressure():
+    source = FakeConsumer(range(100))
+
+    async def run():
+        async def identity(x):
+            return x
+
+        stream = amap_attempt(identity, source, limit=2)
+        await anext(stream)
+        await asyncio.sleep(0.01)
+        await stream.aclose()
+
+    asyncio.run(run())
+    assert source.pulled <= 3
+
+
+# Test that limit must be positive
+def test_amap_attempt_bad_limit():
+    with raises(ValueError):
+        asyncio.run(collect(amap_attempt(step, FakeConsumer([]), limit=0)))
+
+
+# Test that afilter_map routes failures to the side channel
+def test_afilter_map():
+    async def run():
+        failures = asyncio.Queue(1)
+        values = await collect(afilter_map(step, FakeConsumer(range(5)), failures.put))
+        return values, failures.get_nowait()
+
+    values, error = asyncio.run(run())
+    assert values == [0, 2, 4, 8]
+    assert isinstance(error, ValueError)
+
+
+# Test that apartition splits a stream of attempts
+def test_apartition():
+    async def run():
+        attempts = FakeConsumer(
+            [Success(1), Failure("a"), Success(2), Failure("b")] * 10
+        )
+        successes, failures = apartition(attempts, maxsize=2)
+        return await asyncio.gather(collect(successes), collect(failures))
+
+    successes, failures = asyncio.run(run())
+    assert successes == [1, 2] * 10
+    assert failures == ["a", "b"] * 10
+
+
+# Test that apartition raises source errors from both sides
+def test_apartition_error():
+    async def broken():
+        yield Success(1)
+        raise RuntimeError("source")
+
+    async def run():
+        successes, failures = apartition(broken())
+        return await asyncio.gather(
+            collect(successes), collect(failures), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+# Test that closing one side of apartition does not stall the other
+def test_apartition_close_one_side():
+    async def run():
+        attempts = FakeConsumer(
+            [Success(1), Failure("a"), Success(2), Failure("b")] * 10
+        )
+        successes, failures = apartition(attempts, maxsize=2)
+        async for _ in successes:
+            break
+        await successes.aclose()
+        return await asyncio.wait_for(collect(failures), 1)
+
+    assert asyncio.run(run()) == ["a", "b"] * 10
+
+
+# Test that synchronous @attempt steps are supported
+def test_amap_attempt_sync_attempt_step():
+    from monadic_error.utils import attempt
+
+    step = attempt(int)
+    results = asyncio.run(collect(amap_attempt(step, FakeConsumer(["1", "x", "2"]))))
+    assert results[0] == Success(1)
+    assert isinstance(results[1].unwrap_f_or(None), ValueError)
+    assert results[2] == Success(2)
+
+    values = asyncio.run(collect(afilter_map(step, FakeConsumer(["1", "x", "2"]))))
+    assert values == [1, 2]
+
+
+# Test that consuming only one side of apartition stops the source
+def test_apartition_one_side_only():
+    async def run():
+        attempts = FakeConsumer([Success(1), Failure("a")] * 20)
+        successes, _ = apartition(attempts, maxsize=2)
+        async for _ in successes:
+            break
+        await successes.aclose()
+        await asyncio.sleep(0.01)
+        others = asyncio.all_tasks() - {asyncio.current_task()}
+        return attempts.pulled, all(task.done() for task in others)
+
+    pulled, stopped = asyncio.run(run())
+    assert stopped
+    assert pulled < 40
@@ -77,3 +77,49 @@ def test_flatten():
     assert flatten(Some(Some(1))) == Some(1)
     assert flatten(Some(Nothing())) == Nothing()
     assert flatten(Nothing()) == Nothing()
+
+
+# Test that specialized wrappers behave like the generic ones
+def test_attempt_specialize():
+    @attempt(specialize=True)
+    def test_func(a, /, b, c=2, *args, d, e=4, **kwargs):
+        if a < 0:
+            raise ValueError(a)
+        return (a, b, c, args, d, e, kwargs)
+
+    assert test_func(1, 2, d=3) == Success((1, 2, 2, (), 3, 4, {}))
+    assert test_func(1, b=2, c=5, d=3, f=6) == Success((1, 2, 5, (), 3, 4, {"f": 6}))
+    assert test_func(1, 2, 3, 4, d=5, e=6) == Success((1, 2, 3, (4,), 5, 6, {}))
+    assert isinstance(test_func(-1, 2, d=3).unwrap_f_or(None), ValueError)
+
+
+# Test that specialized wrappers keep the signature and metadata
+def test_attempt_specialize_signature():
+    from inspect import signature
+
+    def test_func(a: int, /, b: int = 1) -> int:
+        """Docs."""
+        return a + b
+
+    wrapped = attempt(test_func, specialize=True)
+    assert wrapped.__wrapped__ is test_func
+    assert wrapped.__doc__ == "Docs."
+    assert signature(wrapped) == signature(test_func)
+    assert signature(wrapped, follow_wrapped=False) == signature(test_func)
+    assert wrapped(1) == Success(2)
+
+
+# Test that specialized option wrappers work
+def test_option_specialize():
+    @option(specialize=True)
+    def test_func(x, *, y=1):
+        return x // y
+
+    assert test_func(4, y=2) == Some(2)
+    assert test_func(4, y=0) == Nothing()
+
+
+# Test that functions without a readable signature fall back to the generic wrapper
+def test_attempt_specialize_fallback():
+    assert attempt(int, specialize=True)("1") == Success(1)
+    assert isinstance(attempt(int, specialize=True)("x").unwrap_f_or(None), ValueError)
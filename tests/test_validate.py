@@ -0,0 +1,81 @@
+"""
+test_validate.py
+Ian Kollipara <ian.kollipara@cune.edu>
+2026.10.19
+
+Test Record Validation
+"""
+
+from pytest import raises
+
+# Imports
+from monadic_error.attempt import Failure, Success
+from monadic_error.validate import FieldError, Schema, check
+
+SCHEMA = Schema(
+    {
+        "name": check(lambda s: len(s) > 0, "name is empty"),
+        "age": (int, check(lambda n: n >= 0, "age is negative")),
+    }
+)
+
+
+# Test that a valid record is a Success of the validated fields
+def test_schema_valid():
+    assert SCHEMA.validate({"name": "Ian", "age": "30", "extra": 1}) == Success(
+        {"name": "Ian", "age": 30}
+    )
+
+
+# Test that every field error is accumulated
+def test_schema_accumulates():
+    errors = SCHEMA.validate({"name": "", "age": "-1"}).unwrap_f_or(None)
+    assert [(e.field, str(e.error)) for e in errors] == [
+        ("name", "name is empty"),
+        ("age", "age is negative"),
+    ]
+
+
+# Test that a missing field is a KeyError
+def test_schema_missing():
+    errors = SCHEMA.validate({"name": "Ian"}).unwrap_f_or(None)
+    assert len(errors) == 1
+    assert errors[0].field == "age"
+    assert isinstance(errors[0].error, KeyError)
+
+
+# Test that a chain stops at the first error
+def test_schema_chain_stops():
+    errors = SCHEMA.validate({"name": "Ian", "age": "x"}).unwrap_f_or(None)
+    assert isinstance(errors[0].error, ValueError)
+    assert errors == [FieldError("age", errors[0].error)]
+
+
+# Test that records are validated lazily
+def test_schema_validate_many():
+    def records():
+        yield {"name": "a", "age": 1}
+        raise RuntimeError("not reached")
+
+    results = SCHEMA.validate_many(records())
+    assert next(results) == Success({"name": "a", "age": 1})
+    with raises(RuntimeError):
+        next(results)
+
+
+# Test that validators returning Attempts are unwrapped
+def test_schema_attempt_validators():
+    from monadic_error.utils import attempt
+
+    @attempt
+    def positive(n):
+        if n < 0:
+            raise ValueError("negative")
+        return n
+
+    schema = Schema(
+        {"n": (int, positive, lambda n: Failure("odd") if n % 2 else Success(n))}
+    )
+    assert schema.validate({"n": "2"}) == Success({"n": 2})
+    assert str(schema.validate({"n": -2}).unwrap_f_or(None)[0].error) == "negative"
+    assert schema.validate({"n": 3}) == Failure([FieldError("n", "odd")])